@@ -128,12 +128,13 @@ def custom_reduce(cls, states):
     """For customizing object serialization in `__reduce__`.
 
     Object states provided here are used as keyword arguments to the
-    `._rebuild()` class method.
+    `._rebuild()` class method, or as positional arguments if given as a
+    tuple.
 
     Parameters
     ----------
-    states : dict
-        Dictionary of object states to be serialized.
+    states : dict or tuple
+        Object states to be serialized.
 
     Returns
     -------
@@ -149,6 +150,8 @@ def custom_rebuild(custom_pickled):
     This function is referenced internally by `custom_reduce()`.
     """
     cls, states = custom_pickled.ctor, custom_pickled.states
+    if isinstance(states, tuple):
+        return cls._rebuild(*states)
     return cls._rebuild(**states)
 
 
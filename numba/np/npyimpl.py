@@ -14,7 +14,6 @@ import numpy as np
 import operator
 
 from numba.np import arrayobj, ufunc_db, numpy_support
-from numba.np.ufunc.sigparse import parse_signature
 from numba.core.imputils import (Registry, impl_ret_new_ref, force_error_model,
                                  impl_ret_borrowed)
 from numba.core import typing, types, utils, cgutils, callconv, config
@@ -562,7 +561,7 @@ def numpy_ufunc_kernel(context, builder, sig, args, ufunc, kernel_class):
 
 def numpy_gufunc_kernel(context, builder, sig, args, ufunc, kernel_class):
     arguments = []
-    expected_ndims = kernel_class.dufunc.expected_ndims()
+    expected_ndims = ufunc.expected_ndims()
     expected_ndims = expected_ndims[0] + expected_ndims[1]
     is_input = [True] * ufunc.nin + [False] * ufunc.nout
     for arg, ty, exp_ndim, is_inp in zip(args, sig.args, expected_ndims, is_input):  # noqa: E501
@@ -606,10 +605,10 @@ def numpy_gufunc_kernel(context, builder, sig, args, ufunc, kernel_class):
     loopshape_ndim = outputs[0].ndim - outputs[0].inner_arr_ty.ndim
     loopshape = outputs[0].shape[ : loopshape_ndim]
 
-    _sig = parse_signature(ufunc.gufunc_builder.signature)
+    gufunc_builder = ufunc.gufunc_builder
     for (idx_a, sig_a), (idx_b, sig_b) in itertools.combinations(
             zip(range(len(arguments)),
-            _sig[0] + _sig[1]),
+            gufunc_builder.sin + gufunc_builder.sout),
             r = 2
     ):
         # For each pair of arguments, both inputs and outputs, must match their
@@ -638,6 +637,8 @@ def numpy_gufunc_kernel(context, builder, sig, args, ufunc, kernel_class):
 
 # Kernels are the code to be executed inside the multidimensional loop.
 class _Kernel(object):
+    __slots__ = ('context', 'builder', 'outer_sig')
+
     def __init__(self, context, builder, outer_sig):
         self.context = context
         self.builder = builder
@@ -1,16 +1,22 @@
+import numpy as np
+
 from numba import typeof
 from numba.core import types
 from numba.np.ufunc.ufuncbuilder import GUFuncBuilder
-from numba.np.ufunc.sigparse import parse_signature
 from numba.np.ufunc.ufunc_base import UfuncBase, UfuncLowererBase
 from numba.np.numpy_support import ufunc_find_matching_loop
 from numba.core import serialize, errors
 from numba.core.typing import npydecl
 from numba.core.typing.templates import signature, AbstractTemplate
 import functools
+import itertools
 
 
-def make_gufunc_kernel(_dufunc):
+@functools.cache
+def _get_gufunc_kernel_class():
+    # npyimpl registers lowering implementations on import, so it must not
+    # be imported with this module; the kernel class is created once, on
+    # first use, and shared by all gufuncs.
     from numba.np import npyimpl
 
     class GUFuncKernel(npyimpl._Kernel):
@@ -19,12 +25,13 @@ def make_gufunc_kernel(_dufunc):
         (element-wise function) inside a broadcast loop (which is
         generated by npyimpl.numpy_gufunc_kernel()).
         """
-        dufunc = _dufunc
+        __slots__ = ('gufunc', 'inner_sig', 'cres')
 
-        def __init__(self, context, builder, outer_sig):
+        def __init__(self, context, builder, outer_sig, gufunc):
             super().__init__(context, builder, outer_sig)
-            ewise_types = self.dufunc._get_ewise_dtypes(outer_sig.args)
-            self.inner_sig, self.cres = self.dufunc.find_ewise_function(
+            self.gufunc = gufunc
+            ewise_types = gufunc._get_ewise_dtypes(outer_sig.args)
+            self.inner_sig, self.cres = gufunc.find_ewise_function(
                 ewise_types)
 
         def cast(self, val, fromty, toty):
@@ -42,13 +49,18 @@ def make_gufunc_kernel(_dufunc):
             self.context.add_linking_libs((self.cres.library,))
             return super().generate(*args)
 
-    GUFuncKernel.__name__ += _dufunc.__name__
     return GUFuncKernel
 
 
+def make_gufunc_kernel(gufunc):
+    return functools.partial(_get_gufunc_kernel_class(), gufunc=gufunc)
+
+
 class GUFuncLowerer(UfuncLowererBase):
     '''Callable class responsible for lowering calls to a specific gufunc.
     '''
+    __slots__ = ()
+
     def __init__(self, gufunc):
         from numba.np import npyimpl
         super().__init__(gufunc,
@@ -56,6 +68,16 @@ class GUFuncLowerer(UfuncLowererBase):
                          npyimpl.numpy_gufunc_kernel)
 
 
+def _ewise_key(ewise_types):
+    """
+    Return a hashable key for a sequence of element-wise types.
+
+    Numba types are interned and carry a unique integer code, which is
+    cheaper to hash and compare than the type objects themselves.
+    """
+    return tuple(ty._code for ty in ewise_types)
+
+
 class GUFunc(serialize.ReduceMixin, UfuncBase):
     """
     Dynamic generalized universal function (GUFunc)
@@ -66,53 +88,70 @@ class GUFunc(serialize.ReduceMixin, UfuncBase):
 
     def __init__(self, py_func, signature, identity=None, cache=None,
                  is_dynamic=False, targetoptions={}, writable_args=()):
+        self._initialize(py_func, signature, identity, cache, is_dynamic,
+                         targetoptions, writable_args)
+        self._finalize()
+
+    def _initialize(self, py_func, signature, identity, cache, is_dynamic,
+                    targetoptions, writable_args):
         self.ufunc = None
         self._frozen = False
         self._is_dynamic = is_dynamic
         self._identity = identity
+        # Argument type keys seen by __call__ for which self.ufunc is known
+        # to have a matching loop
+        self._loop_cache = set()
+        # Maps the _ewise_key() of a tuple of element-wise types to the
+        # matching (signature, compile result) pair in the dispatcher
+        self._ewise_index = {}
+        # Number of dispatcher overloads already recorded in _ewise_index
+        self._n_indexed = 0
+        # Typing class created by the first _install_type() call
+        self._ty_cls = None
 
         # GUFunc cannot inherit from GUFuncBuilder because "identity"
         # is a property of GUFunc. Thus, we hold a reference to a GUFuncBuilder
         # object here
         self.gufunc_builder = GUFuncBuilder(
             py_func, signature, identity, cache, targetoptions, writable_args)
+        # The layout signature never changes after construction; reuse the
+        # parse done by the builder instead of re-tokenizing it on each call
+        self._parsed_sig = (self.gufunc_builder.sin, self.gufunc_builder.sout)
+        self._in_ndims = tuple(map(len, self._parsed_sig[0]))
+        self._out_ndims = tuple(map(len, self._parsed_sig[1]))
+        self._expected_nargs = len(self._in_ndims) + len(self._out_ndims)
 
         self.__name__ = self.gufunc_builder.py_func.__name__
         self.__doc__ = self.gufunc_builder.py_func.__doc__
         self._dispatcher = self.gufunc_builder.nb_func
-        self._initialize(self._dispatcher)
-        functools.update_wrapper(self, py_func)
+        self._install_type()
 
-    def _initialize(self, dispatcher):
+    def _finalize(self):
+        # Installing the lowering needs the ufunc's nin and nout, so it
+        # happens once the ufunc has been built
         self.build_ufunc()
-        self._install_type()
         self._lower_me = GUFuncLowerer(self)
         self._install_cg()
+        functools.update_wrapper(self, self.gufunc_builder.py_func)
 
     def _reduce_states(self):
         gb = self.gufunc_builder
-        dct = dict(
-            py_func=gb.py_func,
-            signature=gb.signature,
-            identity=self._identity,
-            cache=gb.cache,
-            is_dynamic=self._is_dynamic,
-            targetoptions=gb.targetoptions,
-            writable_args=gb.writable_args,
-            typesigs=gb._sigs,
-            frozen=self._frozen,
-        )
-        return dct
+        # Positional states, in the order of the _rebuild() parameters
+        return (gb.py_func, gb.signature, self._identity, gb.cache,
+                self._is_dynamic, gb.targetoptions, gb.writable_args,
+                gb._sigs, self._frozen)
 
     @classmethod
     def _rebuild(cls, py_func, signature, identity, cache, is_dynamic,
                  targetoptions, writable_args, typesigs, frozen):
-        self = cls(py_func=py_func, signature=signature, identity=identity,
-                   cache=cache, is_dynamic=is_dynamic,
-                   targetoptions=targetoptions, writable_args=writable_args)
+        # Bypass __init__ so the ufunc is built only once, after all the
+        # cached signatures have been added
+        self = cls.__new__(cls)
+        self._initialize(py_func, signature, identity, cache, is_dynamic,
+                         targetoptions, writable_args)
         for sig in typesigs:
             self.add(sig)
-        self.build_ufunc()
+        self._finalize()
         self._frozen = frozen
         return self
 
@@ -128,21 +167,46 @@ class GUFunc(serialize.ReduceMixin, UfuncBase):
         """
         if typingctx is None:
             typingctx = self._dispatcher.targetdescr.typing_context
-        _ty_cls = type('GUFuncTyping_' + self.__name__,
-                       (AbstractTemplate,),
-                       dict(key=self, generic=self._type_me))
+        # The typing class only depends on self, create it once and reuse it
+        # for every typing context it is installed into
+        _ty_cls = self._ty_cls
+        if _ty_cls is None:
+            _ty_cls = type('GUFuncTyping_' + self.__name__,
+                           (AbstractTemplate,),
+                           dict(key=self, generic=self._type_me))
+            self._ty_cls = _ty_cls
         typingctx.insert_user_function(self, _ty_cls)
 
     def add(self, fty):
-        self.gufunc_builder.add(fty)
+        cres = self.gufunc_builder.add(fty)
+        self._index_overloads()
+        return cres
+
+    def _index_overloads(self):
+        """
+        Record the element-wise types of the dispatcher overloads added
+        since the last call in self._ewise_index.  The dispatcher only ever
+        appends overloads, so each one is visited exactly once.
+        """
+        overloads = self._dispatcher.overloads
+        if len(overloads) == self._n_indexed:
+            return
+        index = self._ewise_index
+        new = itertools.islice(overloads.items(), self._n_indexed, None)
+        for sig, cres in new:
+            key = _ewise_key(self._get_ewise_dtypes(sig.args))
+            # An earlier overload with the same element-wise types takes
+            # precedence, as it would in a scan of the dispatcher overloads
+            index.setdefault(key, (sig, cres))
+        self._n_indexed = len(overloads)
 
     def build_ufunc(self):
         self.ufunc = self.gufunc_builder.build_ufunc()
+        self._loop_cache.clear()
         return self
 
     def expected_ndims(self):
-        parsed_sig = parse_signature(self.gufunc_builder.signature)
-        return (tuple(map(len, parsed_sig[0])), tuple(map(len, parsed_sig[1])))
+        return self._in_ndims, self._out_ndims
 
     def _type_me(self, argtys, kws):
         """
@@ -181,50 +245,52 @@ class GUFunc(serialize.ReduceMixin, UfuncBase):
                 msg = f"cannot call {self} with types {argtys}"
                 raise errors.TypingError(msg)
             self._compile_for_argtys(ewise_types)
-            # double check to ensure there is a match
-            sig, _ = self.find_ewise_function(ewise_types)
-            if sig == (None, None):
+            # add() indexed the new overload, double check there is a match
+            sig, _ = self._ewise_index.get(_ewise_key(ewise_types),
+                                           (None, None))
+            if sig is None:
                 msg = f"Fail to compile {self.__name__} with types {argtys}"
                 raise errors.TypingError(msg)
 
-            assert sig is not None
-
         return signature(types.none, *argtys)
 
     def _compile_for_argtys(self, argtys, return_type=None):
         # Compile a new guvectorize function! Use the gufunc signature
         # i.e. (n,m),(m)->(n)
         # plus ewise_types to build a numba function type
-        fnty = self._get_function_type(*argtys)
-        self.gufunc_builder.add(fnty)
-
-    def match_signature(self, ewise_types, sig):
-        dtypes = self._get_ewise_dtypes(sig.args)
-        return tuple(dtypes) == tuple(ewise_types)
+        fnty = self._get_function_type(argtys)
+        return self.add(fnty)
+
+    def _lookup_ewise_function(self, ewise_types):
+        # Use the element-wise index instead of scanning the dispatcher
+        key = _ewise_key(ewise_types)
+        found = self._ewise_index.get(key)
+        if found is not None:
+            return found
+        # Overloads compiled directly through the dispatcher have not been
+        # seen by add()
+        self._index_overloads()
+        return self._ewise_index.get(key, (None, None))
 
     @property
     def is_dynamic(self):
         return self._is_dynamic
 
     def _get_ewise_dtypes(self, args):
-        argtys = map(lambda arg: arg if isinstance(arg, types.Type) else
-                     typeof(arg), args)
+        # Called on every dynamic dispatch, keep the loop tight
+        Type, Array = types.Type, types.Array
         tys = []
-        for argty in argtys:
-            if isinstance(argty, types.Array):
-                tys.append(argty.dtype)
-            else:
-                tys.append(argty)
+        for arg in args:
+            argty = arg if isinstance(arg, Type) else typeof(arg)
+            tys.append(argty.dtype if isinstance(argty, Array) else argty)
         return tys
 
     def _num_args_match(self, *args):
-        parsed_sig = parse_signature(self.gufunc_builder.signature)
-        return len(args) == len(parsed_sig[0]) + len(parsed_sig[1])
+        return len(args) == self._expected_nargs
 
-    def _get_function_type(self, *args):
-        parsed_sig = parse_signature(self.gufunc_builder.signature)
+    def _get_function_type(self, ewise_types):
         # ewise_types is a list of [int32, int32, int32, ...]
-        ewise_types = self._get_ewise_dtypes(args)
+        parsed_sig = self._parsed_sig
 
         # first time calling the gufunc
         # generate a signature based on input arguments
@@ -248,12 +314,15 @@ class GUFunc(serialize.ReduceMixin, UfuncBase):
     def __call__(self, *args, **kwargs):
         # If compilation is disabled OR it is NOT a dynamic gufunc
         # call the underlying gufunc
-        if self._frozen or not self.is_dynamic:
+        if self._frozen or not self._is_dynamic:
             # Do not unwrap the ufunc if the argument is a wrapper that will
             # potentially pickle the ufunc after it receives it in
             # __array_ufunc__. The same logic in theory should be replicated
             # for reduce(), outer(), etc., but they're not implemented in dask.
-            if args and _is_array_wrapper(args[0]):
+            # A plain ndarray is never such a wrapper, so skip the attribute
+            # probing for the common case.
+            if (args and type(args[0]) is not np.ndarray
+                    and _is_array_wrapper(args[0])):
                 return args[0].__array_ufunc__(
                     self, "__call__", *args, **kwargs
                 )
@@ -263,7 +332,7 @@ class GUFunc(serialize.ReduceMixin, UfuncBase):
             # If "out" argument is supplied
             args += (kwargs.pop("out"),)
 
-        if self._num_args_match(*args) is False:
+        if len(args) != self._expected_nargs:
             # It is not allowed to call a dynamic gufunc without
             # providing all the arguments
             # see: https://github.com/numba/numba/pull/5938#discussion_r506429392  # noqa: E501
@@ -275,16 +344,21 @@ class GUFunc(serialize.ReduceMixin, UfuncBase):
             raise TypeError(msg)
 
         # at this point we know the gufunc is a dynamic one
+        key = tuple(a.dtype if isinstance(a, np.ndarray) else typeof(a)._code
+                    for a in args)
+        if key in self._loop_cache:
+            return self.ufunc(*args, **kwargs)
+
         ewise = self._get_ewise_dtypes(args)
         if not (self.ufunc and ufunc_find_matching_loop(self.ufunc, ewise)):
             # A previous call (@njit -> @guvectorize) may have compiled a
             # version for the element-wise dtypes. In this case, we don't need
             # to compile it again, just build the (g)ufunc
             if not self.find_ewise_function(ewise) != (None, None):
-                sig = self._get_function_type(*args)
-                self.add(sig)
+                self._compile_for_argtys(ewise)
             self.build_ufunc()
 
+        self._loop_cache.add(key)
         return self.ufunc(*args, **kwargs)
 
 
@@ -1,10 +1,28 @@
+import functools
+
 from numba.np import numpy_support
 from numba.core import types
 
 
+@functools.cache
+def _cg_sigs(nin, nout):
+    """
+    Return the lowering signatures registered by _install_cg() for a ufunc
+    with *nin* inputs and *nout* outputs.
+    """
+    _any = types.Any
+    _arr = types.Array
+    # Either all outputs are explicit or none of them are
+    sig0 = (_any,) * nin + (_arr,) * nout
+    sig1 = (_any,) * nin
+    return sig0, sig1
+
+
 class UfuncLowererBase:
     '''Callable class responsible for lowering calls to a specific gufunc.
     '''
+    __slots__ = ('ufunc', 'make_ufunc_kernel_fn', 'kernel', 'libs')
+
     def __init__(self, ufunc, make_kernel_fn, make_ufunc_kernel_fn):
         self.ufunc = ufunc
         self.make_ufunc_kernel_fn = make_ufunc_kernel_fn
@@ -84,13 +102,9 @@ class UfuncBase:
         """
         if targetctx is None:
             targetctx = self._dispatcher.targetdescr.target_context
-        _any = types.Any
-        _arr = types.Array
-        # Either all outputs are explicit or none of them are
-        sig0 = (_any,) * self.ufunc.nin + (_arr,) * self.ufunc.nout
-        sig1 = (_any,) * self.ufunc.nin
+        sigs = _cg_sigs(self.ufunc.nin, self.ufunc.nout)
         targetctx.insert_func_defn(
-            [(self._lower_me, self, sig) for sig in (sig0, sig1)])
+            [(self._lower_me, self, sig) for sig in sigs])
 
     def find_ewise_function(self, ewise_types):
         """
@@ -107,6 +121,13 @@ class UfuncBase:
             if loop is None:
                 return None, None
             ewise_types = tuple(loop.inputs + loop.outputs)[:len(ewise_types)]
+        return self._lookup_ewise_function(ewise_types)
+
+    def _lookup_ewise_function(self, ewise_types):
+        """
+        Return the (signature, compilation result) pair in the dispatcher
+        matching exactly the given element-wise types, or two None's.
+        """
         for sig, cres in self._dispatcher.overloads.items():
             if self.match_signature(ewise_types, sig):
                 return sig, cres
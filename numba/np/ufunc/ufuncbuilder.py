@@ -349,6 +349,10 @@ class GUFuncBuilder(_BaseUFuncBuilder):
         self.cache = cache
         self._sigs = []
         self._cres = {}
+        # Maps a signature to the compile result its loop was built from and
+        # the result of build(), so that rebuilding the ufunc after adding a
+        # signature does not recompile the wrappers of the existing loops
+        self._built = {}
 
         transform_arg = _get_transform_arg(py_func)
         self.writable_args = tuple([transform_arg(a) for a in writable_args])
@@ -371,9 +375,13 @@ class GUFuncBuilder(_BaseUFuncBuilder):
 
         # Get signature in the order they are added
         keepalive = []
+        built = self._built
         for sig in self._sigs:
             cres = self._cres[sig]
-            dtypenums, ptr, env = self.build(cres)
+            entry = built.get(sig)
+            if entry is None or entry[0] is not cres:
+                entry = built[sig] = cres, self.build(cres)
+            dtypenums, ptr, env = entry[1]
             type_list.append(dtypenums)
             func_list.append(int(ptr))
             keepalive.append((cres.library, env))
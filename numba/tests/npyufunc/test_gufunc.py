@@ -196,6 +196,28 @@ class TestDynamicGUFunc(TestCase):
 
         self.assertEqual(len(gufunc.types), 2)  # ensure two versions of gufunc
 
+    def test_dynamic_loop_cache(self):
+        gufunc = GUVectorize(axpy, '(), (), () -> ()', target=self.target,
+                             is_dynamic=True)
+        x = np.arange(10, dtype=np.int64)
+        out = np.zeros(10, dtype=np.int64)
+        gufunc(x, x, x, out)
+        self.assertEqual(len(gufunc._loop_cache), 1)
+
+        # a repeated call with the same dtypes is served from the cache
+        ufunc = gufunc.ufunc
+        out[:] = 0
+        gufunc(x, x, x, out)
+        self.assertIs(gufunc.ufunc, ufunc)
+        self.assertEqual(len(gufunc._loop_cache), 1)
+        self.assertPreciseEqual(out, x * x + x)
+
+        # new dtypes trigger a rebuild, which resets the cache
+        y = x.astype(np.float64)
+        gufunc(y, y, y, np.zeros(10, dtype=np.float64))
+        self.assertIsNot(gufunc.ufunc, ufunc)
+        self.assertEqual(len(gufunc._loop_cache), 1)
+        self.assertEqual(len(gufunc.types), 2)
 
     def test_dynamic_ufunc_like(self):
 
@@ -587,6 +609,22 @@ class TestGUVectorizeJit(TestCase):
 
         self.check_add_gufunc(add)
 
+    def test_find_ewise_function_index(self):
+        @guvectorize('(n),()->(n)', target=self.target)
+        def add(x, y, res):
+            for i in range(x.shape[0]):
+                res[i] = x[i] + y
+
+        self.assertEqual(add.find_ewise_function((int64, int32, int64)),
+                         (None, None))
+        self.check_add_gufunc(add)
+
+        ewise_types = (int64, int32, int64)
+        self.assertEqual(len(add._ewise_index), 1)
+        sig, cres = add.find_ewise_function(list(ewise_types))
+        self.assertEqual(sig.args, (int64[:], int32, int64[:]))
+        self.assertIs(cres, add._dispatcher.overloads[sig])
+
     @unittest.expectedFailure
     def test_object_mode(self):
         @guvectorize('(n),()->(n)', target=self.target, forceobj=True)
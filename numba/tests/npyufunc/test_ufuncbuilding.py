@@ -135,6 +135,24 @@ class TestGUfuncBuilding(TestCase):
 
         self.assertPreciseEqual(a + a, b)
 
+    def test_gufunc_rebuild_reuses_loops(self):
+        from numba.tests.npyufunc.ufuncbuilding_usecases import guadd
+        gufb = GUFuncBuilder(guadd, "(x, y),(x, y)->(x, y)")
+        gufb.add("void(int32[:,:], int32[:,:], int32[:,:])")
+        gufb.build_ufunc()
+        built = dict(gufb._built)
+
+        # Adding a signature only builds the wrapper for the new loop
+        gufb.add("void(float64[:,:], float64[:,:], float64[:,:])")
+        ufunc = gufb.build_ufunc()
+        self.assertEqual(len(gufb._built), 2)
+        for sig, entry in built.items():
+            self.assertIs(gufb._built[sig], entry)
+
+        for dtype in ("int32", "float64"):
+            a = np.arange(10, dtype=dtype).reshape(2, 5)
+            self.assertPreciseEqual(a + a, ufunc(a, a))
+
     def test_gufunc_struct_forceobj(self):
         from numba.tests.npyufunc.ufuncbuilding_usecases import guadd
         gufb = GUFuncBuilder(guadd, "(x, y),(x, y)->(x, y)",